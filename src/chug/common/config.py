@@ -26,12 +26,19 @@ class ImageInputCfg(Serializable):
     align_long_axis: Optional[bool] = False
     transform_type: Optional[str] = 'image_basic'
     resize_mode: Optional[str] = 'shortest'
+    dtype: Optional[str] = None  # output dtype of normalized image tensor (e.g. 'bfloat16'), float32 if None
 
     @property
     def image_chs(self):
         return image_mode_to_chs(self.mode)
 
     def __post_init__(self):
+        if self.dtype is not None:
+            import torch  # torch is not otherwise needed for cfg parsing
+            dtype = getattr(torch, self.dtype, None)
+            assert isinstance(dtype, torch.dtype) and dtype.is_floating_point, \
+                f"Image dtype must be a floating point torch dtype, got {self.dtype}."
+
         image_chs = self.image_chs
         if image_chs is not None:
             # ensue mean/std attributes match # image_chs
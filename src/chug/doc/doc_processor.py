@@ -1,20 +1,52 @@
 import abc
+import functools
 import json
 import logging
 import random
-from typing import Callable, Dict, List, Optional, Tuple
+import warnings
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 from chug.common import FeatureInfo, ImageFeatureInfo
 from chug.wds import decode_image_pages, decode_pdf_pages
+from chug.wds.decode import _HAS_LIBJPEG_TURBO
 
 
 from .constants import (
     DEFAULT_DOC_FEAT,
 )
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
 _logger = logging.getLogger(__name__)
 
 
+def _json_loads(data):
+    # orjson is considerably faster for large (per-token/line) OCR annotations, fallback to stdlib json.
+    # NOTE orjson is stricter, NaN / Infinity are rejected (retried w/ stdlib json below) and integers
+    # beyond 64 bits are decoded as floats instead of ints.
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(data)
+
+
+@functools.lru_cache
+def _get_json_decoder(fields: Tuple[str, ...]):
+    # msgspec decoders are not picklable, created (and cached) on first use in each worker process
+    anno_struct = msgspec.defstruct('_DocAnno', [(f, Any, msgspec.UNSET) for f in fields])
+    return msgspec.json.Decoder(anno_struct)
+
+
 def get_next_valid_page_index(
         current_index: int,
         num_pages: int,
@@ -102,6 +134,13 @@ class DocProcessor:
         self.flatten_json = flatten_json
         self.generator = random.Random()
         self.generator.seed(seed)
+        # top-level json fields read by the annotation processing, None to decode all
+        self.json_fields: Optional[Tuple[str, ...]] = None
+        if not _HAS_LIBJPEG_TURBO:
+            # don't fail, but make a silent fallback to the slow Pillow decode path visible
+            warnings.warn(
+                "Pillow is not using libjpeg-turbo, image decode will be slower. Consider installing Pillow-SIMD"
+                " built w/ libjpeg-turbo (see README).")
         # FIXME note, should move to torchvision v2 annotations at some point
         #  * they should all eventually have a generator arg for better handling random state
         #  * they have forms that accept bbox/points args to transform annotations in sync with image
@@ -133,6 +172,7 @@ class DocProcessor:
             sample[ext],
             image_mode=image_mode,
             page_indices=page_indices,
+            ext=ext,
         )
         if num_image_pages != num_anno_pages:
             _logger.warning(
@@ -149,12 +189,14 @@ class DocProcessor:
             ext,
             page_indices,
             num_anno_pages,
+            render_mask=None,
     ):
         image_mode = self.image_input_feat.image_mode
         decoded_pages, num_image_pages = decode_pdf_pages(
             sample[ext],
             image_mode=image_mode,
             page_indices=page_indices,
+            render_mask=render_mask,
         )
         if num_anno_pages is not None and num_image_pages != num_anno_pages:
             _logger.warning(
@@ -165,6 +207,19 @@ class DocProcessor:
 
         return decoded_pages, num_image_pages
 
+    def _decode_json(self, data):
+        fields = self.json_fields
+        if msgspec is None or not fields or not all(f.isidentifier() for f in fields):
+            return _json_loads(data)
+
+        # only materialize the fields that are used, the rest of the json is skipped while parsing
+        try:
+            decoded = _get_json_decoder(fields).decode(data)
+        except msgspec.DecodeError:
+            # not a json object (e.g. top-level list), or json msgspec rejects that stdlib json accepts (NaN, etc)
+            return _json_loads(data)
+        return {f: v for f in fields if (v := getattr(decoded, f)) is not msgspec.UNSET}
+
     @abc.abstractmethod
     def _decode_anno(self, sample) -> Tuple[Dict, List[int], int]:
         pass
@@ -183,7 +238,7 @@ class DocProcessor:
     def __call__(self, sample):
         if 'json' in sample and isinstance(sample['json'], bytes):
             # decode json if present and in undecoded state
-            sample['json'] = json.loads(sample['json'])
+            sample['json'] = self._decode_json(sample['json'])
 
         if self.flatten_json and 'json' in sample:
             # flatten json into sample
@@ -199,11 +254,14 @@ class DocProcessor:
         for ext in self.image_input_key:
             if ext in sample:
                 if ext == 'pdf':
+                    # annotation processing can flag pages that don't need pixels (e.g. text only tasks)
+                    render_mask = page_anno.get('_parse', {}).get('render_mask', None)
                     images, num_image_pages = self._decode_pdf_pages(
                         sample,
                         ext,
                         page_indices,
                         num_anno_pages,
+                        render_mask=render_mask,
                     )
                 else:
                     images, num_image_pages = self._decode_image_pages(
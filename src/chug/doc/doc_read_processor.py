@@ -38,6 +38,7 @@ class DocReadProcessor(DocProcessor):
             seed=seed,
         )
         self.line_break = line_break
+        self.json_fields = tuple(self.text_input_key)
         assert page_sampling in ('random', 'first', 'all_valid', 'all')
 
     def _process_anno_pages(self, anno):
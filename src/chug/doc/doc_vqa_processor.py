@@ -52,6 +52,7 @@ class DocVqaProcessor(DocProcessor):
             # expand pages only used / supported for multi-qa expansion right now
             self.expand_pages = False
             self.multi_qa_key = None
+        self.json_fields = tuple(self.question_key + self.question_id_key + self.answer_key + (self.multi_qa_key or []))
 
         # FIXME support flexible q/a prompting formats, do with prefix/suffix or template strings?
         # Donut style: '<s_docvqa><s_question>{question}</s_question><s_answer>{answer}</answer><eos>'
@@ -2,7 +2,7 @@ from typing import Optional
 
 from chug.common import ImageInputCfg, ImageAugCfg
 
-from .transforms_torch import AlignLongAxis, Bitmap, Erosion, Dilation, CropMargin
+from .transforms_torch import AlignLongAxis, Bitmap, Erosion, Dilation, CropMargin, ToNormalizedTensor
 
 # NOTE, chug currently depends on some time aug impl, this should be flipped if timm ends up
 # leveraging chug data pipelines.
@@ -41,10 +41,11 @@ def build_transforms_doc_basic(
             CenterCropOrPad(image_size, fill=input_cfg.fill_color),
         ]
 
-    pp += [transforms.ToTensor()]
-
     if do_normalize:
-        pp += [transforms.Normalize(input_cfg.mean, input_cfg.std)]
+        # ToTensor + Normalize fused into one conversion
+        pp += [ToNormalizedTensor(input_cfg.mean, input_cfg.std, dtype=input_cfg.dtype)]
+    else:
+        pp += [ToNormalizedTensor(dtype=input_cfg.dtype)]
 
     return transforms.Compose(pp) if composed else pp
 
@@ -166,10 +167,11 @@ def build_transforms_doc_better(
             CenterCropOrPad(image_size, fill=input_cfg.fill_color),
         ]
 
-    pp += [transforms.ToTensor()]
-
     if do_normalize:
-        pp += [transforms.Normalize(input_cfg.mean, input_cfg.std)]
+        # ToTensor + Normalize fused into one conversion
+        pp += [ToNormalizedTensor(input_cfg.mean, input_cfg.std, dtype=input_cfg.dtype)]
+    else:
+        pp += [ToNormalizedTensor(dtype=input_cfg.dtype)]
 
     return transforms.Compose(pp) if composed else pp
 
@@ -324,8 +326,10 @@ def build_transforms_doc_nougat(
         # FIXME leave alb uncomposed too if composed=False?
         tv_pp += [AlbWrapper(alb.Compose(alb_pp))]
 
-    tv_pp += [transforms.ToTensor()]
     if do_normalize:
-        tv_pp += [transforms.Normalize(input_cfg.mean, input_cfg.std)]
+        # ToTensor + Normalize fused into one conversion
+        tv_pp += [ToNormalizedTensor(input_cfg.mean, input_cfg.std, dtype=input_cfg.dtype)]
+    else:
+        tv_pp += [ToNormalizedTensor(dtype=input_cfg.dtype)]
 
     return transforms.Compose(tv_pp) if composed else tv_pp
@@ -1,6 +1,7 @@
 from dataclasses import asdict
 from typing import Any, Dict, Optional, Union
 
+import torch
 from torchvision import transforms
 from timm.data import (
     ResizeKeepRatio,
@@ -10,7 +11,7 @@ from timm.data import (
 )
 
 from chug.common import ImageInputCfg, ImageAugCfg
-from .transforms_torch import ConvertColor
+from .transforms_torch import ConvertColor, ToNormalizedTensor
 
 
 def build_transforms_image_timm(
@@ -43,6 +44,15 @@ def build_transforms_image_timm(
     else:
         aug_cfg = aug_cfg or ImageAugCfg.imagenet()
 
+    # NOTE w/o normalization timm (prefetcher mode) outputs uint8, a float dtype cast doesn't apply
+    assert do_normalize or input_cfg.dtype is None, \
+        f"Output dtype ({input_cfg.dtype}) is only supported with do_normalize=True for image_timm transforms."
+    dtype_cast = []
+    if input_cfg.dtype:
+        dtype = getattr(torch, input_cfg.dtype)
+        assert dtype.is_floating_point, f"Output dtype ({input_cfg.dtype}) must be a floating point type."
+        dtype_cast = [transforms.ConvertImageDtype(dtype)]
+
     if is_training:
         aug_cfg_dict = {k: v for k, v in asdict(aug_cfg).items() if v is not None}
         aug_cfg_dict.setdefault('color_jitter', None)  # disable by default
@@ -59,6 +69,8 @@ def build_transforms_image_timm(
             interpolation=interpolation,
             **aug_cfg_dict,
         )
+        if dtype_cast:
+            train_transform = transforms.Compose([train_transform] + dtype_cast)
         return train_transform
     else:
         if resize_mode == 'longest':
@@ -80,6 +92,8 @@ def build_transforms_image_timm(
             # FIXME
             # composed=composed,
         )
+        if dtype_cast:
+            eval_transform = transforms.Compose([eval_transform] + dtype_cast)
         return eval_transform
 
 
@@ -93,11 +107,6 @@ def build_transforms_image_basic(
 ):
     """ Build image transfoms leveraging torchvision transforms.
     """
-    if do_normalize:
-        normalize = transforms.Normalize(mean=input_cfg.mean, std=input_cfg.std)
-    else:
-        normalize = None
-
     interpolation = input_cfg.interpolation or 'bicubic'
     assert interpolation in ['bicubic', 'bilinear', 'random']
     # NOTE random is ignored for interpolation_mode, so defaults to BICUBIC for inference if set
@@ -195,9 +204,10 @@ def build_transforms_image_basic(
             transform_list.append(ConvertColor(mode=input_cfg.mode))
     # end if is_training
 
-    transform_list += [transforms.ToTensor()]
-
-    if normalize is not None:
-        transform_list += [normalize]
+    if do_normalize:
+        # ToTensor + Normalize fused into one conversion
+        transform_list += [ToNormalizedTensor(input_cfg.mean, input_cfg.std, dtype=input_cfg.dtype)]
+    else:
+        transform_list += [ToNormalizedTensor(dtype=input_cfg.dtype)]
 
     return transforms.Compose(transform_list) if composed else transform_list
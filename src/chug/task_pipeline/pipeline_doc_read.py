@@ -5,7 +5,7 @@ import webdataset as wds
 
 from chug.common import DataTaskCfg, FeatureInfo, ImageFeatureInfo
 from chug.doc import DocReadProcessor, DEFAULT_DOC_FEAT
-from chug.wds import get_error_handler
+from chug.wds import get_error_handler, map_prefetch
 
 
 @dataclass
@@ -15,6 +15,7 @@ class DataTaskDocReadCfg(DataTaskCfg):
     text_target_feat: Optional[FeatureInfo] = FeatureInfo('text_target', input_key=None)
     page_sampling: str = 'random'
     render_dpi: int = 150
+    prefetch: int = 0  # decode samples ahead in a background thread, 0 to disable
 
 
 def build_task_pipeline_doc_read(
@@ -26,7 +27,7 @@ def build_task_pipeline_doc_read(
     # document decoding & pre-processing done together, there is coupling in random page
     # selection and in the future, masking of image and/or text
     pipe += [
-        wds.map(
+        map_prefetch(
             DocReadProcessor(
                 image_process_fn=cfg.image_process_fn,
                 text_process_fn=cfg.text_process_fn,
@@ -37,6 +38,7 @@ def build_task_pipeline_doc_read(
                 render_dpi=cfg.render_dpi,
                 flatten_json=cfg.flatten_json,
             ),
+            prefetch=cfg.prefetch,
             handler=handler,
         )
     ]
@@ -5,7 +5,7 @@ from typing import Callable, Dict, Optional, Union
 import webdataset as wds
 
 from chug.common import DataTaskCfg, FeatureInfo, ImageFeatureInfo
-from chug.wds import get_error_handler
+from chug.wds import get_error_handler, map_prefetch
 from chug.doc import (
     DocVqaProcessor,
     DEFAULT_DOC_KEY,
@@ -60,6 +60,7 @@ class DataTaskDocVqaCfg(DataTaskCfg):
         answer_prefix:
         answer_suffix:
         render_dpi:
+        prefetch: Number of processed samples to decode ahead in a background thread, 0 to disable.
     """
     answer_feat: FeatureInfo = DEFAULT_ANSWER_FEAT
     question_feat: FeatureInfo = DEFAULT_QUESTION_FEAT
@@ -73,6 +74,7 @@ class DataTaskDocVqaCfg(DataTaskCfg):
     answer_suffix: Optional[str] = '</s_answer>'
     # FIXME prompt templates instead of prefix+suffix above?
     render_dpi: int = 144
+    prefetch: int = 0
 
 
 def build_task_pipeline_doc_vqa(
@@ -83,7 +85,7 @@ def build_task_pipeline_doc_vqa(
     handler = get_error_handler(cfg.error_handler)
 
     pipe = [
-        wds.map(
+        map_prefetch(
             DocVqaProcessor(
                 image_process_fn=cfg.image_process_fn,
                 text_process_fn=cfg.text_process_fn,
@@ -97,6 +99,7 @@ def build_task_pipeline_doc_vqa(
                 answer_prefix=cfg.answer_prefix,
                 answer_suffix=cfg.answer_suffix,
             ),
+            prefetch=cfg.prefetch,
             handler=handler,
         )
     ]
@@ -1,5 +1,5 @@
 from .decode import decode_pdf_pages, decode_image_pages, create_image_decoder, DecodeDoc
-from .filters import detshuffle_v2, map_v2, map_expand_maybe, map_expand_always, flatten_nested
+from .filters import detshuffle_v2, map_v2, map_prefetch, map_expand_maybe, map_expand_always, flatten_nested
 from .helpers import log_and_continue, expand_urls, get_error_handler
 from .loader import create_loader_wds
 from .pipeline import build_data_pipeline
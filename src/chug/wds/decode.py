@@ -4,11 +4,11 @@ import os
 import random
 import re
 import warnings
-from typing import Any, Callable, Dict, Optional, Tuple, Union
+from typing import Any, Callable, Dict, Optional, Sequence, Tuple, Union
 
 import numpy as np
 import webdataset as wds
-from PIL import Image
+from PIL import Image, features
 
 from .helpers import log_and_continue
 
@@ -16,7 +16,7 @@ from .helpers import log_and_continue
 # IMPORTANT fitz aka PyMuPDF is AGPL licensed w/ a commercial purchase option, manual intervention required to use it.
 _USE_AGPL_PYMUPDF = int(os.environ.get('CHUG_USE_AGPL_PYMUPDF', -1))
 if _USE_AGPL_PYMUPDF < 1:
-    import importlib
+    import importlib.util
     if importlib.util.find_spec('fitz') is not None and _USE_AGPL_PYMUPDF == -1:
         # warn if not explicitly disable by setting to 0
         warnings.warn(
@@ -40,11 +40,50 @@ else:
 
 _logger = logging.getLogger(__name__)
 
+# Pillow-SIMD w/ libjpeg-turbo backend is significantly faster for decode + resize, plain Pillow still works
+_HAS_LIBJPEG_TURBO = bool(features.check_feature('libjpeg_turbo'))
+
 
 PDF_EXTENSIONS = {
     'pdf',
 }
 
+# PIL format ids for known image extensions, used to skip PIL's probing of every registered format
+_EXT_TO_PIL_FORMAT = {
+    'tif': 'TIFF',
+    'tiff': 'TIFF',
+    'png': 'PNG',
+    'jpg': 'JPEG',
+    'jpeg': 'JPEG',
+    'webp': 'WEBP',
+}
+
+
+def _select_page_indices(
+        page_indices: Optional[Sequence[int]],
+        num_pages: int,
+        select_random: Optional[int] = None,
+):
+    if page_indices is not None:
+        page_indices = [p % num_pages for p in page_indices]  # support -ve indexing
+    else:
+        page_indices = range(num_pages)
+
+    if select_random:
+        if select_random == 1:
+            page_indices = [random.choice(page_indices)]
+        else:
+            page_indices = random.sample(page_indices, select_random)
+            page_indices.sort()
+
+    return page_indices
+
+
+def _blank_page(image_mode: str, width_pt: float, height_pt: float, render_dpi: int):
+    # white page w/ the size the page would have been rendered at
+    size = (round(width_pt * render_dpi / 72), round(height_pt * render_dpi / 72))
+    return Image.new(image_mode, size, color='white')
+
 
 def decode_pdf_pages(
         data: bytes,
@@ -52,8 +91,18 @@ def decode_pdf_pages(
         page_indices: Optional[Tuple[int]] = None,
         select_random: Optional[int] = None,
         render_dpi: int = 144,
+        render_mask: Optional[Sequence[bool]] = None,
 ):
+    """ decode (render) pages of a PDF document
+
+    If render_mask is set, it must align with page_indices. Pages with a False mask are not
+    rendered, a blank page of the same size is returned in their place.
+    """
     rendered_pages = []
+    if render_mask is not None:
+        assert page_indices is not None and not select_random, \
+            "render_mask requires explicit page_indices"
+        assert len(render_mask) == len(page_indices)
 
     with io.BytesIO(data) as b:
         # FIXME test and use an alternate pdf reader/render as default
@@ -61,36 +110,43 @@ def decode_pdf_pages(
             doc = fitz.Document(stream=b)
             num_doc_pages = doc.page_count
 
-            if page_indices is not None:
-                page_indices = [p % num_doc_pages for p in page_indices]  # support -ve indexing
+            page_indices = _select_page_indices(page_indices, num_doc_pages, select_random)
+
+            if image_mode == 'L':
+                fitz_cs = fitz.csGRAY
+                fitz_mode = 'L'
+                alpha = False
+            elif image_mode == 'RGB' or image_mode == 'BGR':
+                fitz_cs = fitz.csRGB
+                fitz_mode = 'RGB'
+                alpha = False
+            elif image_mode == 'RGBA' or image_mode == 'BGRA':
+                fitz_cs = fitz.csRGB
+                fitz_mode = 'RGBA'
+                alpha = True
             else:
-                page_indices = range(num_doc_pages)
+                assert False
+            # NOTE pages are rendered serially, MuPDF contexts are not safe to share across threads
+            render_matrix = fitz.Matrix(render_dpi / 72, render_dpi / 72)
 
-            if select_random:
-                if select_random == 1:
-                    page_indices = [random.choice(page_indices)]
-                else:
-                    page_indices = random.sample(page_indices, select_random)
-                    page_indices.sort()
-
-            for i in page_indices:
+            for j, i in enumerate(page_indices):
                 page = doc.load_page(i)
-                if image_mode == 'L':
-                    fitz_cs = fitz.csGRAY
-                    fitz_mode = 'L'
-                    alpha = False
-                elif image_mode == 'RGB' or image_mode == 'BGR':
-                    fitz_cs = fitz.csRGB
-                    fitz_mode = 'RGB'
-                    alpha = False
-                elif image_mode == 'RGBA' or image_mode == 'BGRA':
-                    fitz_cs = fitz.csRGB
-                    fitz_mode = 'RGBA'
-                    alpha = True
-                else:
-                    assert False
-                pixmap = page.get_pixmap(dpi=render_dpi, colorspace=fitz_cs, alpha=alpha)
-                page_image = Image.frombuffer(fitz_mode, (pixmap.width, pixmap.height), pixmap.samples)
+                if render_mask is not None and not render_mask[j]:
+                    rendered_pages += [_blank_page(fitz_mode, page.rect.width, page.rect.height, render_dpi)]
+                    continue
+                pixmap = page.get_pixmap(matrix=render_matrix, colorspace=fitz_cs, alpha=alpha)
+                # samples_mv is a view of the pixmap memory (vs a bytes copy w/ .samples), it is not safe
+                # to use past the pixmap lifetime so frombytes is used to make the single owned copy
+                samples = pixmap.samples_mv if hasattr(pixmap, 'samples_mv') else pixmap.samples
+                page_image = Image.frombytes(
+                    fitz_mode,
+                    (pixmap.width, pixmap.height),
+                    samples,
+                    'raw',
+                    fitz_mode,
+                    pixmap.stride,
+                    1,
+                )
                 if fitz_mode != page_image.mode:
                     page_image = page_image.convert(image_mode)
 
@@ -101,16 +157,18 @@ def decode_pdf_pages(
             reverse = 'RGB' in image_mode
             doc = pypdfium2.PdfDocument(data)
             num_doc_pages = len(doc)
-            page_indices = page_indices or range(num_doc_pages)
-            if select_random:
-                page_indices = [random.choice(page_indices)]
-            for i in page_indices:
+            page_indices = _select_page_indices(page_indices, num_doc_pages, select_random)
+            for j, i in enumerate(page_indices):
                 page = doc[i]
-                page_image = page.render(
-                    scale=render_dpi / 72,
-                    grayscale=grayscale,
-                    rev_byteorder=reverse,  # RGB instead of BGR(X)
-                ).to_pil()
+                if render_mask is not None and not render_mask[j]:
+                    # blank page in the mode render() + to_pil() produces, converted below like rendered pages
+                    page_image = _blank_page('L' if grayscale else 'RGB', *page.get_size(), render_dpi)
+                else:
+                    page_image = page.render(
+                        scale=render_dpi / 72,
+                        grayscale=grayscale,
+                        rev_byteorder=reverse,  # RGB instead of BGR(X)
+                    ).to_pil()
                 if image_mode != page_image.mode:
                     page_image = page_image.convert(image_mode)
 
@@ -127,28 +185,31 @@ def decode_image_pages(
         image_mode: str = 'L',
         page_indices: Optional[Tuple[int]] = None,
         select_random: Optional[int] = None,
+        ext: Optional[str] = None,
 ):
-    """ decode multi-page image (e.g. TIFF)"""
+    """ decode multi-page image (e.g. TIFF)
+
+    If ext is a known image extension, PIL is told which format to open instead of probing all formats.
+    """
     decoded_pages = []
 
     if isinstance(data, Image.Image):
         doc_image = data
     else:
-        doc_image = Image.open(io.BytesIO(data))
+        doc_image = None
+        pil_format = _EXT_TO_PIL_FORMAT.get(ext.lower()) if ext else None
+        if pil_format is not None:
+            try:
+                doc_image = Image.open(io.BytesIO(data), formats=(pil_format,))
+            except Image.UnidentifiedImageError:
+                # extension doesn't match content, fallback to probing
+                pass
+        if doc_image is None:
+            doc_image = Image.open(io.BytesIO(data))
 
     num_image_pages = getattr(doc_image, 'n_frames', 1)
 
-    if page_indices is not None:
-        page_indices = [p % num_image_pages for p in page_indices]  # support -ve indexing
-    else:
-        page_indices = range(num_image_pages)
-
-    if select_random:
-        if select_random == 1:
-            page_indices = [random.choice(page_indices)]
-        else:
-            page_indices = random.sample(page_indices, select_random)
-            page_indices.sort()
+    page_indices = _select_page_indices(page_indices, num_image_pages, select_random)
 
     for i, page_index in enumerate(page_indices):
         assert page_index < num_image_pages
@@ -158,7 +219,12 @@ def decode_image_pages(
             assert page_index == 0, "not a multi-page image"
             doc_image.load()
 
-        page_image = doc_image.convert(image_mode)
+        if doc_image.mode == image_mode and len(page_indices) == 1:
+            # convert() to the same mode is a full copy, only needed to detach pages from further seeks
+            page_image = doc_image
+            page_image.load()
+        else:
+            page_image = doc_image.convert(image_mode)
         decoded_pages.append(page_image)
 
     return decoded_pages, num_image_pages
@@ -247,6 +313,7 @@ class DecodeDoc:
                 image_mode=mode.upper(),
                 page_indices=page_indices,
                 select_random=select_random,
+                ext=extension,
             )
 
         if atype == "pil":
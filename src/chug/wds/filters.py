@@ -1,9 +1,11 @@
 import itertools
+import queue
 import random
+import threading
 from typing import Mapping, Sequence, Union
 
 import webdataset as wds
-from webdataset.filters import _shuffle
+from webdataset.filters import _map, _shuffle
 
 from chug.common import SharedCount, get_pytorch_worker_seed
 
@@ -70,6 +72,67 @@ def _map_v2(data, f, handler=wds.reraise_exception):
 map_v2 = wds.pipelinefilter(_map_v2)
 
 
+_PREFETCH_END = object()
+
+
+def _put_until_stopped(q: queue.Queue, item, stop: threading.Event):
+    while not stop.is_set():
+        try:
+            q.put(item, timeout=0.1)
+            return True
+        except queue.Full:
+            continue
+    return False
+
+
+def _prefetch_worker(data, f, handler, q: queue.Queue, stop: threading.Event):
+    item = (_PREFETCH_END, None)
+    try:
+        for result in _map(data, f, handler=handler):
+            if not _put_until_stopped(q, (result, None), stop):
+                return
+    except BaseException as exn:
+        item = (_PREFETCH_END, exn)
+    finally:
+        # always signal the end (w/ any exception) so the consumer never waits on a dead thread
+        _put_until_stopped(q, item, stop)
+
+
+def _map_prefetch(data, f, prefetch=2, handler=wds.reraise_exception):
+    """ Map samples, w/ f applied in a background thread that runs ahead of the consumer.
+
+    Behaves like wds.map, but reading samples from upstream + f (e.g. document decode) overlap
+    with downstream consumption. Up to `prefetch` results are buffered, prefetch <= 0 disables
+    the thread.
+    """
+    if prefetch <= 0:
+        yield from _map(data, f, handler=handler)
+        return
+
+    q = queue.Queue(maxsize=prefetch)
+    stop = threading.Event()
+    thread = threading.Thread(target=_prefetch_worker, args=(data, f, handler, q, stop), daemon=True)
+    thread.start()
+    try:
+        while True:
+            try:
+                result, exn = q.get(timeout=1.0)
+            except queue.Empty:
+                if not thread.is_alive() and q.empty():
+                    raise RuntimeError("Prefetch thread exited without signalling the end of samples.")
+                continue
+            if exn is not None:
+                raise exn
+            if result is _PREFETCH_END:
+                break
+            yield result
+    finally:
+        stop.set()
+
+
+map_prefetch = wds.pipelinefilter(_map_prefetch)
+
+
 def _expand_maybe(data, f, handler=wds.reraise_exception):
     for sample in data:
         if isinstance(sample, Mapping):
@@ -1,12 +1,17 @@
+import functools
+import itertools
 import logging
 import os
 
+from typing import Tuple
 from urllib.parse import urlparse
 
 import braceexpand
+import numpy as np
 import webdataset as wds
 
 
+@functools.lru_cache(maxsize=4096)
 def urldir(url):
     """Return the directory part of a url."""
     parsed_url = urlparse(url)
@@ -15,6 +20,12 @@ def urldir(url):
     return parsed_url._replace(path=directory).geturl()
 
 
+@functools.lru_cache(maxsize=4096)
+def _expand_one(url: str) -> Tuple[str, ...]:
+    """Brace expand a single url, cached as shard patterns repeat across calls."""
+    return tuple(braceexpand.braceexpand(url))
+
+
 def expand_urls(urls, weights=None):
     if weights is None:
         expanded_urls = wds.shardlists.expand_urls(urls)
@@ -25,13 +36,12 @@ def expand_urls(urls, weights=None):
         weights = weights.split('::')
         assert len(weights) == len(urllist), \
             f"Expected the number of data components ({len(urllist)}) and weights({len(weights)}) to match."
-        weights = [float(weight) for weight in weights]
-        all_urls, all_weights = [], []
-        for url, weight in zip(urllist, weights):
-            expanded_url = list(braceexpand.braceexpand(url))
-            expanded_weights = [weight for _ in expanded_url]
-            all_urls.extend(expanded_url)
-            all_weights.extend(expanded_weights)
+        expanded_urls = [_expand_one(url) for url in urllist]
+        all_urls = list(itertools.chain.from_iterable(expanded_urls))
+        all_weights = np.repeat(
+            np.asarray(weights, dtype=np.float64),
+            [len(eu) for eu in expanded_urls],
+        ).tolist()
         return all_urls, all_weights
     else:
         all_urls = list(urls)
@@ -49,8 +59,6 @@ def dump_and_reraise(exn):
     import traceback
     exception_trace = ''.join(traceback.format_tb(exn.__traceback__))
     logging.error(f'Handling webdataset {type(exn)}. Exception trace:\n {exception_trace}')
-    current_trace = ''.join(traceback.format_tb(exn.__traceback__))
-    logging.error(f'Current stack trace:\n {current_trace}')
     raise exn
 
 